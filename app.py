@@ -2,13 +2,21 @@ from __future__ import annotations
 
 import sys
 import os
+import argparse
+import hashlib
+import json
+import pickle
+import tempfile
+import time
+from calendar import monthrange
+from functools import lru_cache
 from dataclasses import dataclass, field
-from datetime import date, timedelta
+from datetime import date
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, Signal, Slot
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QGridLayout, QMessageBox, QDialog, QScrollArea, QFrame, QLineEdit
+    QGridLayout, QMessageBox, QDialog, QScrollArea, QFrame, QLineEdit, QProgressBar
 )
 
 from excel_io import ExcelIO, H1, H2
@@ -17,12 +25,144 @@ from excel_io import ExcelIO, H1, H2
 BASE_DIR = r"P:\10245_Dateiupload-Qliksense-VGSG-K5\03_Service GW und int Produktbetreuung\01_MOIA Technik"
 DEFAULT_FILENAME = "Stundennachweis DLV 2026 1.0.xlsm"
 
+# Cache für load_lists (Inhalt-Hash -> Listen), spart openpyxl beim Start
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".stundenapp_cache")
+CACHE_INDEX = os.path.join(CACHE_DIR, "index.json")  # Pfad -> (mtime, Größe, Hash)
+CACHE_MAX_AGE_DAYS = 30
+
+# Button-Styles als Property-Selektoren, wird einmal am QApplication gesetzt (main).
+# Kacheln: tileState = norm/sel/dis, Kalendertage: dayState = we/filled/sel
+APP_STYLESHEET = """
+QPushButton[tileState="norm"] { background:#4a4a58; color:white; }
+QPushButton[tileState="sel"] { background:#32a852; color:white; font-weight:600; }
+QPushButton[tileState="dis"] { background:#3a3a46; color:#9a9aaa; }
+QPushButton[dayState="we"] { background:#3a3a46; color:white; }
+QPushButton[dayState="filled"] { background:#2f6fb3; color:white; }
+QPushButton[dayState="sel"] { background:#32a852; color:white; font-weight:600; }
+"""
+
+# Was neu gezeichnet werden muss (Bitmaske für _mark_dirty)
+DIRTY_INFO = 1
+DIRTY_CAL = 2
+DIRTY_VIS = 4
+DIRTY_SEL = 8  # nur Kalender-Auswahl geändert
+
 
 def build_excel_path(filename: str) -> str:
     filename = (filename or "").strip()
     return os.path.join(BASE_DIR, filename)
 
 
+def _atomic_write(path: str, data: bytes):
+    # Erst temp-Datei, dann umbenennen -> nie halb geschriebene Cache-Dateien
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except Exception:
+        os.remove(tmp)
+        raise
+
+
+def _cached_load_lists(
+    io: ExcelIO, use_cache: bool = True, refresh: bool = False
+) -> tuple[list[str], list[str], list[str]]:
+    """
+    Wie io.load_lists(), aber mit Datei-Cache unter CACHE_DIR.
+    Schlüssel ist der SHA256 des Datei-Inhalts, der Dateiname wird zusätzlich geprüft.
+    Solange mtime und Größe der Datei gleich sind, wird der Hash aus CACHE_INDEX genommen
+    (kein komplettes Einlesen der Datei). Einträge älter als CACHE_MAX_AGE_DAYS werden verworfen.
+    refresh=True liest immer neu aus Excel und aktualisiert den Cache.
+    """
+    if not use_cache:
+        return io.load_lists()
+
+    path = io.file_path
+    try:
+        st = os.stat(path)
+    except OSError:
+        # Datei nicht lesbar -> Fehlermeldung kommt aus load_lists (mit Retry)
+        return io.load_lists()
+
+    key = os.path.abspath(path)
+    stamp = [st.st_mtime_ns, st.st_size]
+    try:
+        with open(CACHE_INDEX, "rb") as f:
+            index = json.load(f)
+    except Exception:
+        index = {}
+
+    entry = index.get(key) or {}
+    digest = entry.get("digest") if entry.get("stamp") == stamp else None
+    if digest is None:
+        try:
+            # Unter der Datei-Sperre lesen: ein offenes Handle ließe ein gleichzeitiges Speichern scheitern
+            with io.locked(), open(path, "rb") as f:
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+        except OSError:
+            return io.load_lists()
+        index[key] = {"stamp": stamp, "digest": digest}
+        try:
+            _atomic_write(CACHE_INDEX, json.dumps(index).encode("utf-8"))
+        except Exception:
+            pass
+
+    name = os.path.basename(path)
+    cache_file = os.path.join(CACHE_DIR, f"{digest}.pkl")
+
+    if not refresh:
+        try:
+            if time.time() - os.stat(cache_file).st_mtime > CACHE_MAX_AGE_DAYS * 86400:
+                os.remove(cache_file)
+            else:
+                with open(cache_file, "rb") as f:
+                    entry = pickle.load(f)
+                if entry.get("filename") == name:
+                    return entry["lists"]
+        except Exception:
+            pass
+
+    lists = io.load_lists()
+
+    try:
+        _atomic_write(cache_file, pickle.dumps({"filename": name, "lists": lists}))
+    except Exception:
+        pass
+
+    return lists
+
+
+def _load_lists(
+    io: ExcelIO, use_cache: bool, refresh: bool
+) -> tuple[ExcelIO, tuple[list[str], list[str], list[str]]]:
+    """Listen laden (läuft im Worker), io kommt mit zurück (veraltete Antworten erkennen)."""
+    return io, _cached_load_lists(io, use_cache, refresh)
+
+
+def _load_filled_days(io: ExcelIO, emp: str, month: date) -> tuple[ExcelIO, str, date, frozenset[int]]:
+    """Gefüllte Tage (als Tageszahlen) laden (läuft im Worker), Fehler -> leere Menge."""
+    try:
+        days = io.get_filled_days_for_employee(emp=emp, month=month)
+    except Exception:
+        days = set()
+    nums = frozenset(d.day for d in days if d.year == month.year and d.month == month.month)
+    return io, emp, month, nums
+
+
+@lru_cache(maxsize=32)
+def _month_meta(year: int, month: int) -> tuple[int, int, tuple[date, ...], tuple[int, ...]]:
+    """
+    Kalender-Geometrie eines Monats: (Wochentag des 1., letzter Tag, Tage, Wochentage).
+    Tage und Wochentage sind parallele Tupel (Index 0 = Tag 1).
+    """
+    first_weekday, last_day = monthrange(year, month)
+    days = tuple(date(year, month, d) for d in range(1, last_day + 1))
+    weekdays = tuple((first_weekday + i) % 7 for i in range(last_day))
+    return first_weekday, last_day, days, weekdays
+
+
 @dataclass
 class State:
     emp: str = ""
@@ -34,8 +174,111 @@ class State:
     d_to: date | None = None
     month: date = date.today().replace(day=1)
 
-    # NEU: gefüllte Tage im aktuellen Monat (für Markierung)
-    filled_days: set[date] = field(default_factory=set)
+    # NEU: gefüllte Tage (Tageszahlen) für filled_month (für Markierung)
+    filled_day_nums: frozenset[int] = field(default_factory=frozenset)
+    filled_month: date | None = None
+
+
+class ExcelWorkerSignals(QObject):
+    finished = Signal(object)
+    failed = Signal(object)
+
+
+class ExcelWorker(QRunnable):
+    """
+    Führt einen blockierenden Excel-Aufruf im QThreadPool aus,
+    Ergebnis/Fehler kommen per Signal zurück in den UI-Thread.
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = ExcelWorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(e)
+            return
+        self.signals.finished.emit(result)
+
+
+class LazyTileArea(QScrollArea):
+    """
+    Kachel-Raster (3 Spalten), das nur die sichtbaren Zeilen als Buttons anlegt.
+    Beim Scrollen werden die Buttons aus einem Pool neu belegt (tile_value).
+    styler(btn) wird nach jeder Neubelegung aufgerufen (Markierung/Ausgrauen).
+    """
+
+    COLS = 3
+    TILE_HEIGHT = 28
+    SPACING = 6
+    ROW_HEIGHT = TILE_HEIGHT + SPACING
+
+    def __init__(self, handler, styler):
+        super().__init__()
+        self._handler = handler
+        self._styler = styler
+        self._items: list[str] = []
+        self._pool: list[QPushButton] = []
+
+        self._cont = QWidget()
+        self.setWidgetResizable(True)
+        self.setWidget(self._cont)
+        self.setMinimumHeight(140)
+        self.verticalScrollBar().setSingleStep(self.ROW_HEIGHT)
+        self.verticalScrollBar().valueChanged.connect(self._layout_visible)
+
+    def set_items(self, items: list[str]):
+        self._items = list(items)
+        rows = -(-len(self._items) // self.COLS)
+        self._cont.setMinimumHeight(rows * self.ROW_HEIGHT + self.SPACING)
+        self._layout_visible()
+
+    def buttons(self) -> list[QPushButton]:
+        """Aktuell belegte (sichtbare) Buttons."""
+        return [b for b in self._pool if b.isVisibleTo(self._cont)]
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._layout_visible()
+
+    @Slot()
+    def _on_tile_clicked(self):
+        # Ein Slot für alle Pool-Buttons, Wert kommt aus der Property
+        self._handler(self.sender().property("tile_value"))
+
+    def _layout_visible(self, *_):
+        n = len(self._items)
+        top = self.verticalScrollBar().value()
+        first_row = max(top // self.ROW_HEIGHT - 1, 0)
+        last_row = (top + self.viewport().height()) // self.ROW_HEIGHT + 1
+        first = first_row * self.COLS
+        last = min((last_row + 1) * self.COLS, n)
+
+        sp = self.SPACING
+        width = max((self.viewport().width() - sp * (self.COLS + 1)) // self.COLS, 1)
+
+        for k, idx in enumerate(range(first, last)):
+            if k == len(self._pool):
+                btn = QPushButton(self._cont)
+                btn.clicked.connect(self._on_tile_clicked)
+                self._pool.append(btn)
+            btn = self._pool[k]
+            r, c = divmod(idx, self.COLS)
+            btn.setGeometry(sp + c * (width + sp), sp + r * self.ROW_HEIGHT, width, self.TILE_HEIGHT)
+            if btn.property("tile_value") != self._items[idx]:
+                btn.setText(self._items[idx])
+                btn.setProperty("tile_value", self._items[idx])
+            btn.show()
+            self._styler(btn)
+
+        for btn in self._pool[max(last - first, 0):]:
+            btn.hide()
+            btn.setProperty("tile_value", None)
 
 
 class RestDialog(QDialog):
@@ -54,7 +297,8 @@ class RestDialog(QDialog):
             if p.strip().lower() == exclude.strip().lower():
                 continue
             btn = QPushButton(p)
-            btn.clicked.connect(lambda _, x=p: self._select(x))
+            btn.setProperty("proj", p)
+            btn.clicked.connect(self._on_pick)
             grid.addWidget(btn, r, c)
             c += 1
             if c >= 3:
@@ -74,40 +318,50 @@ class RestDialog(QDialog):
         row.addWidget(skip)
         lay.addLayout(row)
 
+    @Slot()
+    def _on_pick(self):
+        self._select(self.sender().property("proj"))
+
     def _select(self, p: str):
         self.pick = p
         self.accept()
 
 
 class App(QWidget):
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         super().__init__()
         self.setWindowTitle("StundenApp (Desktop)")
 
         self.state = State()
+        self.use_cache = use_cache
+        self._dirty = 0
 
-        # Buttons merken (Markierung/Ausgrauen)
-        self.emp_buttons: list[QPushButton] = []
-        self.proj_buttons: list[QPushButton] = []
-        self.abs_buttons: list[QPushButton] = []
+        # Stunden-Buttons merken (Markierung/Ausgrauen)
         self.hour_buttons: list[QPushButton] = []
 
         # Dateiname (änderbar)
         self.filename = DEFAULT_FILENAME
-        self.io = ExcelIO(build_excel_path(self.filename))
+        self._set_excel_file(self.filename)
 
-        # Listen laden
-        try:
-            self.emps, self.projs, self.abss = self.io.load_lists()
-        except Exception as e:
-            QMessageBox.critical(self, "Fehler", str(e))
-            self.emps, self.projs, self.abss = ["Muster"], ["MOIA", "DiE"], ["Urlaub", "Krank"]
+        # Listen kommen asynchron (siehe _start_load_lists). Der Worker startet vor dem
+        # Aufbau der Oberfläche, das Ergebnis kommt erst über die Event-Loop an.
+        self.emps, self.projs, self.abss = [], [], []
+        self._start_load_lists(self._on_initial_lists, self._on_initial_lists_failed)
 
         self._build_ui()
+        self.busy.show()
         self._render_info()
         self._render_calendar()
         self._apply_visual_state()
 
+    def _set_excel_file(self, filename: str):
+        # Schreiben nur im GUI-Thread (self.io), Lesen in den Workern über eine eigene
+        # Instanz -> die Worker teilen sich keine Caches mit dem Schreibpfad.
+        # Beide nutzen denselben Lock pro Datei, Lesen und Schreiben laufen also nie gleichzeitig
+        path = build_excel_path(filename)
+        self.io = ExcelIO(path)
+        self.io_read = ExcelIO(path)
+
     # ---------------- UI ----------------
     def _build_ui(self):
         root = QVBoxLayout(self)
@@ -122,6 +376,11 @@ class App(QWidget):
         reload_btn = QPushButton("Neu laden")
         reload_btn.clicked.connect(self._reload_from_filename)
         file_row.addWidget(reload_btn)
+        self.busy = QProgressBar()
+        self.busy.setRange(0, 0)  # unbestimmt, läuft bis die Listen da sind
+        self.busy.setMaximumWidth(120)
+        self.busy.hide()
+        file_row.addWidget(self.busy)
         root.addLayout(file_row)
 
         self.info = QLabel("")
@@ -137,7 +396,8 @@ class App(QWidget):
         main.addLayout(left, 1)
 
         left.addWidget(QLabel("Mitarbeiter"))
-        left.addWidget(self._tile_area(self.emps, self._pick_emp, self.emp_buttons))
+        self.emp_area = LazyTileArea(self._pick_emp, self._style_emp_tile)
+        left.addWidget(self.emp_area)
 
         row = QHBoxLayout()
         btn_p = QPushButton("Projekt")
@@ -149,7 +409,8 @@ class App(QWidget):
         left.addLayout(row)
 
         left.addWidget(QLabel("Projekte"))
-        left.addWidget(self._tile_area(self.projs, self._pick_proj, self.proj_buttons))
+        self.proj_area = LazyTileArea(self._pick_proj, self._style_proj_tile)
+        left.addWidget(self.proj_area)
 
         row2 = QHBoxLayout()
         row2.addWidget(QLabel("Stunden"))
@@ -163,7 +424,8 @@ class App(QWidget):
         self.hour_buttons = [b1, b2]
 
         left.addWidget(QLabel("Abwesenheit"))
-        left.addWidget(self._tile_area(self.abss, self._pick_abs, self.abs_buttons))
+        self.abs_area = LazyTileArea(self._pick_abs, self._style_abs_tile)
+        left.addWidget(self.abs_area)
 
         # Right (Calendar)
         right = QVBoxLayout()
@@ -184,6 +446,23 @@ class App(QWidget):
         self.cal_grid = QGridLayout()
         right.addLayout(self.cal_grid)
 
+        # Kalender-Raster einmalig anlegen: Kopfzeile + 6 Wochen x 7 Tage
+        dow = ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"]
+        for i, d in enumerate(dow):
+            lab = QLabel(d)
+            lab.setAlignment(Qt.AlignCenter)
+            self.cal_grid.addWidget(lab, 0, i)
+
+        self._day_buttons: list[QPushButton] = []
+        self._cal_month: date | None = None  # Monat, für den die Buttons beschriftet sind
+        self._last_selection: tuple[date | None, date | None] = (None, None)
+        for idx in range(42):
+            btn = QPushButton("")
+            btn.setMinimumHeight(32)
+            btn.clicked.connect(self._on_day_clicked)
+            self.cal_grid.addWidget(btn, 1 + idx // 7, idx % 7)
+            self._day_buttons.append(btn)
+
         actions = QHBoxLayout()
         save = QPushButton("SPEICHERN ✅")
         reset = QPushButton("AUSWAHL LÖSCHEN")
@@ -193,58 +472,89 @@ class App(QWidget):
         actions.addWidget(reset, 1)
         right.addLayout(actions)
 
-    def _tile_area(self, items: list[str], handler, store_list: list[QPushButton]):
-        cont = QWidget()
-        grid = QGridLayout(cont)
-        grid.setSpacing(6)
-
-        r = c = 0
-        for t in items[:60]:
-            btn = QPushButton(t)
-            btn.setMinimumHeight(28)
-            btn.setProperty("tile_value", t)
-            btn.clicked.connect(lambda _, x=t: handler(x))
-            grid.addWidget(btn, r, c)
-            store_list.append(btn)
-
-            c += 1
-            if c >= 3:
-                c = 0
-                r += 1
-
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setWidget(cont)
-        scroll.setMinimumHeight(140)
-        return scroll
+    def _populate_tiles(self):
+        self.emp_area.set_items(self.emps)
+        self.proj_area.set_items(self.projs)
+        self.abs_area.set_items(self.abss)
+
+    # ---------------- Excel im Hintergrund ----------------
+    def _start_load_lists(self, on_done, on_fail, refresh: bool = False):
+        worker = ExcelWorker(_load_lists, self.io_read, self.use_cache, refresh)
+        worker.signals.finished.connect(on_done)
+        worker.signals.failed.connect(on_fail)
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(object)
+    def _on_initial_lists(self, result):
+        io, lists = result
+        if io is not self.io_read:
+            return  # inzwischen andere Datei gewählt, deren Laden läuft noch
+        self.busy.hide()
+        self.emps, self.projs, self.abss = lists
+        self._populate_tiles()
+
+    @Slot(object)
+    def _on_initial_lists_failed(self, e):
+        self.busy.hide()
+        QMessageBox.critical(self, "Fehler", str(e))
+        self.emps, self.projs, self.abss = ["Muster"], ["MOIA", "DiE"], ["Urlaub", "Krank"]
+        self._populate_tiles()
+
+    @Slot(object)
+    def _on_reload_lists(self, result):
+        io, lists = result
+        if io is not self.io_read:
+            return  # Listen einer inzwischen ersetzten Datei
+        self.busy.hide()
+        self.emps, self.projs, self.abss = lists
+        self._populate_tiles()
+        QMessageBox.information(self, "OK", "Listen aus Excel neu geladen.")
+
+    @Slot(object)
+    def _on_reload_lists_failed(self, e):
+        self.busy.hide()
+        QMessageBox.critical(self, "Fehler", f"Datei konnte nicht geladen werden:\n{e}")
 
     # ---------------- Visual State ----------------
+    def _set_prop_style(self, btn: QPushButton, name: str, value: str):
+        # Nur bei Änderung neu polieren (Stylesheet selbst ist schon geparst)
+        if btn.property(name) == value:
+            return
+        btn.setProperty(name, value)
+        btn.style().unpolish(btn)
+        btn.style().polish(btn)
+
     def _set_btn_style(self, btn: QPushButton, selected: bool, enabled: bool):
+        btn.setEnabled(enabled)
         if not enabled:
-            btn.setEnabled(False)
-            btn.setStyleSheet("background:#3a3a46; color:#9a9aaa;")
-            return
-        btn.setEnabled(True)
-        if selected:
-            btn.setStyleSheet("background:#32a852; color:white; font-weight:600;")
+            self._set_prop_style(btn, "tileState", "dis")
+        elif selected:
+            self._set_prop_style(btn, "tileState", "sel")
         else:
-            btn.setStyleSheet("background:#4a4a58; color:white;")
+            self._set_prop_style(btn, "tileState", "norm")
 
-    def _apply_visual_state(self):
-        s = self.state
-        mode = s.mode
+    def _style_emp_tile(self, b: QPushButton):
+        self._set_btn_style(b, selected=(b.property("tile_value") == self.state.emp), enabled=True)
 
-        proj_enabled = (mode == "PROJ")
-        abs_enabled = (mode == "ABS")
+    def _style_proj_tile(self, b: QPushButton):
+        s = self.state
+        self._set_btn_style(b, selected=(b.property("tile_value") == s.proj), enabled=(s.mode == "PROJ"))
 
-        for b in self.emp_buttons:
-            self._set_btn_style(b, selected=(b.property("tile_value") == s.emp), enabled=True)
+    def _style_abs_tile(self, b: QPushButton):
+        s = self.state
+        self._set_btn_style(b, selected=(b.property("tile_value") == s.abs_type), enabled=(s.mode == "ABS"))
 
-        for b in self.proj_buttons:
-            self._set_btn_style(b, selected=(b.property("tile_value") == s.proj), enabled=proj_enabled)
+    def _apply_visual_state(self):
+        s = self.state
+        proj_enabled = (s.mode == "PROJ")
 
-        for b in self.abs_buttons:
-            self._set_btn_style(b, selected=(b.property("tile_value") == s.abs_type), enabled=abs_enabled)
+        # Nur belegte Kacheln, neu sichtbare stylt LazyTileArea selbst
+        for b in self.emp_area.buttons():
+            self._style_emp_tile(b)
+        for b in self.proj_area.buttons():
+            self._style_proj_tile(b)
+        for b in self.abs_area.buttons():
+            self._style_abs_tile(b)
 
         for b in self.hour_buttons:
             try:
@@ -257,26 +567,60 @@ class App(QWidget):
                 enabled=proj_enabled
             )
 
+    # ---------------- Neu zeichnen (gesammelt) ----------------
+    def _mark_dirty(self, bits: int):
+        # Mehrere Änderungen im selben Event-Loop-Durchlauf -> nur einmal zeichnen
+        if self._dirty == 0:
+            QTimer.singleShot(0, self._flush_dirty)
+        self._dirty |= bits
+
+    def _flush_dirty(self):
+        bits, self._dirty = self._dirty, 0
+        if bits & DIRTY_INFO:
+            self._render_info()
+        if bits & DIRTY_CAL:
+            self._render_calendar()
+        elif bits & DIRTY_SEL:
+            self._restyle_selection()
+        if bits & DIRTY_VIS:
+            self._apply_visual_state()
+
     # ---------------- Excel -> gefüllte Tage laden ----------------
     def _refresh_filled_days(self):
         s = self.state
         if not s.emp:
-            s.filled_days = set()
+            s.filled_day_nums = frozenset()
+            s.filled_month = None
             return
-        try:
-            s.filled_days = self.io.get_filled_days_for_employee(emp=s.emp, month=s.month)
-        except Exception:
-            s.filled_days = set()
+        worker = ExcelWorker(_load_filled_days, self.io_read, s.emp, s.month)
+        worker.signals.finished.connect(self._on_filled_days)
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(object)
+    def _on_filled_days(self, result):
+        io, emp, month, nums = result
+        s = self.state
+        # Veraltete Antwort (anderer Mitarbeiter/Monat/Datei) ignorieren
+        if io is not self.io_read or emp != s.emp or month != s.month:
+            return
+        s.filled_day_nums = nums
+        s.filled_month = month
+        self._mark_dirty(DIRTY_CAL)
 
     # ---------------- Info / Calendar ----------------
+    def _norm_range(self) -> tuple[date | None, date | None]:
+        """Gewählter Zeitraum (von, bis) aufsteigend; ohne Ende gilt bis = von."""
+        d_from = self.state.d_from
+        d_to = self.state.d_to or d_from
+        if d_from and d_to and d_to < d_from:
+            return d_to, d_from
+        return d_from, d_to
+
     def _render_info(self):
         s = self.state
 
         def fmt(d): return d.strftime("%d.%m.%Y") if d else "—"
-        d1 = s.d_from
-        d2 = s.d_to or s.d_from
-        if d1 and d2 and d2 < d1:
-            d1, d2 = d2, d1
+        d1, d2 = self._norm_range()
 
         if s.mode == "PROJ":
             act = f"Projekt: {s.proj or '—'} | Stunden: {str(s.hrs).replace('.', ',') if s.hrs else '—'}"
@@ -290,61 +634,77 @@ class App(QWidget):
         )
 
     def _render_calendar(self):
-        while self.cal_grid.count():
-            item = self.cal_grid.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
-
         s = self.state
         m = s.month
-        self.month_label.setText(m.strftime("%B %Y"))
 
-        dow = ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"]
-        for i, d in enumerate(dow):
-            lab = QLabel(d)
-            lab.setAlignment(Qt.AlignCenter)
-            self.cal_grid.addWidget(lab, 0, i)
+        # Beschriftung/Sichtbarkeit nur bei Monatswechsel, sonst nur Styles
+        relabel = m != self._cal_month
+        self._cal_month = m
+        if relabel:
+            self.month_label.setText(m.strftime("%B %Y"))
 
-        start_offset = m.weekday()  # Monday=0
-        nxt_month = (m.replace(day=28) + timedelta(days=4)).replace(day=1)
-        last_day = (nxt_month - timedelta(days=1)).day
+        start_offset, last_day, days, weekdays = _month_meta(m.year, m.month)  # Monday=0
 
-        d_from = s.d_from
-        d_to = s.d_to or s.d_from
-        if d_from and d_to and d_to < d_from:
-            d_from, d_to = d_to, d_from
+        d_from, d_to = self._norm_range()
 
-        day = 1
-        row = 1
-        col = start_offset
+        self._last_selection = (d_from, d_to)
 
-        while day <= last_day:
-            btn = QPushButton(str(day))
-            btn.setMinimumHeight(32)
+        # Gefüllte Tage nur, wenn sie zum angezeigten Monat gehören
+        filled = s.filled_day_nums if s.filled_month == m else frozenset()
 
-            d = m.replace(day=day)
+        # Buttons bleiben bestehen, es ändern sich nur Text/Sichtbarkeit/Style
+        for idx, btn in enumerate(self._day_buttons):
+            i = idx - start_offset
+            in_month = 0 <= i < last_day
+            if relabel:
+                btn.setVisible(in_month)
+                if in_month:
+                    btn.setText(str(i + 1))
+                    btn.setProperty("day_value", i + 1)
+            if not in_month:
+                continue
+
+            state = self._day_state(days[i], weekdays[i], filled, d_from, d_to)
+            self._set_prop_style(btn, "dayState", state)
 
-            # Wochenende Grundfarbe
-            if d.weekday() >= 5:
-                btn.setStyleSheet("background:#3a3a46; color:white;")
+    def _day_state(self, d: date, weekday: int, filled: frozenset[int], d_from, d_to) -> str:
+        state = ""
 
-            # NEU: Bereits gefüllt -> blau (nur wenn nicht Wochenende überschreibt, ist ok)
-            if d in s.filled_days:
-                btn.setStyleSheet("background:#2f6fb3; color:white;")
+        # Wochenende Grundfarbe
+        if weekday >= 5:
+            state = "we"
 
-            # Auswahl -> grün (übersticht alles)
-            if d_from and d_to and d_from <= d <= d_to:
-                btn.setStyleSheet("background:#32a852; color:white; font-weight:600;")
+        # NEU: Bereits gefüllt -> blau (nur wenn nicht Wochenende überschreibt, ist ok)
+        if d.day in filled:
+            state = "filled"
 
-            btn.clicked.connect(lambda _, x=day: self._click_day(x))
-            self.cal_grid.addWidget(btn, row, col)
+        # Auswahl -> grün (übersticht alles)
+        if d_from and d_to and d_from <= d <= d_to:
+            state = "sel"
 
-            day += 1
-            col += 1
-            if col >= 7:
-                col = 0
-                row += 1
+        return state
+
+    def _restyle_selection(self):
+        """Nach Klick auf einen Tag: nur Buttons neu stylen, deren Auswahl-Status sich geändert hat."""
+        s = self.state
+        m = s.month
+
+        d_from, d_to = self._norm_range()
+
+        old_from, old_to = self._last_selection
+        if (d_from, d_to) == (old_from, old_to):
+            return
+        self._last_selection = (d_from, d_to)
+
+        start_offset, last_day, days, weekdays = _month_meta(m.year, m.month)
+        filled = s.filled_day_nums if s.filled_month == m else frozenset()
+
+        for i, d in enumerate(days):
+            was_sel = bool(old_from and old_to and old_from <= d <= old_to)
+            is_sel = bool(d_from and d_to and d_from <= d <= d_to)
+            if was_sel != is_sel:
+                btn = self._day_buttons[start_offset + i]
+                self._set_prop_style(btn, "dayState", self._day_state(d, weekdays[i], filled, d_from, d_to))
 
     # ---------------- Handlers ----------------
     def _reload_from_filename(self):
@@ -354,25 +714,18 @@ class App(QWidget):
             return
 
         self.filename = new_name
-        self.io = ExcelIO(build_excel_path(self.filename))
-
-        try:
-            self.emps, self.projs, self.abss = self.io.load_lists()
-        except Exception as e:
-            QMessageBox.critical(self, "Fehler", f"Datei konnte nicht geladen werden:\n{e}")
-            return
-
-        QMessageBox.information(
-            self, "OK",
-            "Listen aus Excel neu geladen.\nBitte App neu starten, damit die Kacheln aktualisiert werden."
-        )
+        self._set_excel_file(self.filename)
+        # "Neu laden" liest immer frisch aus Excel (Cache wird dabei aktualisiert)
+        self._start_load_lists(self._on_reload_lists, self._on_reload_lists_failed, refresh=True)
+        self.busy.show()
 
     def _pick_emp(self, x: str):
+        if x != self.state.emp:
+            self.state.filled_day_nums = frozenset()
+            self.state.filled_month = None
         self.state.emp = x
         self._refresh_filled_days()
-        self._render_info()
-        self._render_calendar()
-        self._apply_visual_state()
+        self._mark_dirty(DIRTY_INFO | DIRTY_CAL | DIRTY_VIS)
 
     def _set_mode(self, m: str):
         self.state.mode = m
@@ -381,29 +734,30 @@ class App(QWidget):
         else:
             self.state.proj = ""
             self.state.hrs = None
-        self._render_info()
-        self._apply_visual_state()
+        self._mark_dirty(DIRTY_INFO | DIRTY_VIS)
 
     def _pick_proj(self, x: str):
         self.state.mode = "PROJ"
         self.state.proj = x
         self.state.abs_type = ""
-        self._render_info()
-        self._apply_visual_state()
+        self._mark_dirty(DIRTY_INFO | DIRTY_VIS)
 
     def _pick_hours(self, h: float):
         if self.state.mode != "PROJ" or not self.state.proj:
             return
         self.state.hrs = h
-        self._render_info()
-        self._apply_visual_state()
+        self._mark_dirty(DIRTY_INFO | DIRTY_VIS)
 
     def _pick_abs(self, x: str):
         if self.state.mode != "ABS":
             return
         self.state.abs_type = x
-        self._render_info()
-        self._apply_visual_state()
+        self._mark_dirty(DIRTY_INFO | DIRTY_VIS)
+
+    @Slot()
+    def _on_day_clicked(self):
+        # Ein Slot für alle Tages-Buttons, Tag kommt aus der Property
+        self._click_day(self.sender().property("day_value"))
 
     def _click_day(self, day: int):
         s = self.state
@@ -418,28 +772,27 @@ class App(QWidget):
             s.d_from = clicked
             s.d_to = None
 
-        self._render_info()
-        self._render_calendar()
+        self._mark_dirty(DIRTY_INFO | DIRTY_SEL)
 
     def _prev_month(self):
         m = self.state.month
-        prev = (m.replace(day=1) - timedelta(days=1)).replace(day=1)
+        y, mo = (m.year, m.month - 1) if m.month > 1 else (m.year - 1, 12)
+        prev = date(y, mo, 1)
         self.state.month = prev
         self.state.d_from = None
         self.state.d_to = None
         self._refresh_filled_days()
-        self._render_info()
-        self._render_calendar()
+        self._mark_dirty(DIRTY_INFO | DIRTY_CAL)
 
     def _next_month(self):
         m = self.state.month
-        nxt = (m.replace(day=28) + timedelta(days=4)).replace(day=1)
+        y, mo = (m.year, m.month + 1) if m.month < 12 else (m.year + 1, 1)
+        nxt = date(y, mo, 1)
         self.state.month = nxt
         self.state.d_from = None
         self.state.d_to = None
         self._refresh_filled_days()
-        self._render_info()
-        self._render_calendar()
+        self._mark_dirty(DIRTY_INFO | DIRTY_CAL)
 
     def _reset(self):
         s = self.state
@@ -450,10 +803,9 @@ class App(QWidget):
         s.abs_type = ""
         s.d_from = None
         s.d_to = None
-        s.filled_days = set()
-        self._render_info()
-        self._render_calendar()
-        self._apply_visual_state()
+        s.filled_day_nums = frozenset()
+        s.filled_month = None
+        self._mark_dirty(DIRTY_INFO | DIRTY_CAL | DIRTY_VIS)
 
     def _save(self):
         s = self.state
@@ -468,10 +820,7 @@ class App(QWidget):
             QMessageBox.warning(self, "Hinweis", "Bitte Tätigkeit wählen (Projekt oder Abwesenheit).")
             return
 
-        d1 = s.d_from
-        d2 = s.d_to or s.d_from
-        if d2 < d1:
-            d1, d2 = d2, d1
+        d1, d2 = self._norm_range()
 
         if s.mode == "PROJ":
             if not s.proj:
@@ -511,10 +860,6 @@ class App(QWidget):
             )
             return
 
-        # Nach Speichern: gefüllte Tage neu laden (damit direkt blau wird)
-        self._refresh_filled_days()
-        self._render_calendar()
-
         # Restlogik (3,5h)
         if s.mode == "PROJ" and abs(float(s.hrs) - H1) < 1e-9:
             if d1 == d2:
@@ -543,6 +888,8 @@ class App(QWidget):
                         )
                     except Exception as e:
                         QMessageBox.critical(self, "Fehler", str(e))
+                        # Erste Buchung steht in der Datei -> gefüllte Tage neu laden
+                        self._refresh_filled_days()
                         return
 
                 self._reset()
@@ -556,8 +903,13 @@ class App(QWidget):
 
 
 def main():
-    app = QApplication(sys.argv)
-    w = App()
+    parser = argparse.ArgumentParser(prog="StundenApp")
+    parser.add_argument("--no-cache", action="store_true", help="Listen immer neu aus Excel lesen")
+    args, qt_args = parser.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + qt_args)
+    app.setStyleSheet(APP_STYLESHEET)
+    w = App(use_cache=not args.no_cache)
     w.resize(980, 650)
     w.show()
     sys.exit(app.exec())
@@ -1,10 +1,23 @@
 from __future__ import annotations
+import os
+import posixpath
+import random
+import re
+import tempfile
+import threading
 import time
-from dataclasses import dataclass
+import xml.etree.ElementTree as ET
+import zipfile
+from bisect import bisect_right
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import Optional
+from functools import lru_cache, wraps
+from io import BytesIO
+from typing import Any, Optional
 
-import openpyxl
+# openpyxl wird erst bei Bedarf importiert: der Import allein kostet spürbar
+# Startzeit, die App soll vorher schon sichtbar sein.
 
 
 # ===== Excel Layout (wie VBA) =====
@@ -19,10 +32,19 @@ SUBHEADER_ROW = 4
 FIRST_EMP_COL = 6  # F
 DATE_FIRST_ROW = 5
 DATE_COL = 3       # C
+MAX_EMP_SCAN_COLS = 512  # Obergrenze für die Suche in der Kopfzeile (max_column kann falsch sein)
+
+RETRY_WAIT_MAX_SEC = 5.0
 
 H1 = 3.5
 H2 = 7.0
 
+# ===== OOXML (für patch_cells) =====
+NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+_CELL_REF = re.compile(r"([A-Z]+)(\d+)$")
+
 
 MONTH_DE = {
     1: "Januar",
@@ -54,49 +76,278 @@ def _as_date(v) -> Optional[date]:
     return None
 
 
-def _normalize_key(s: str) -> str:
+def _as_text(v) -> str:
+    # Zellwert als getrimmter Text; str-Werte ohne zusätzliches str()
+    if type(v) is str:
+        return v.strip()
+    return str(v).strip() if v is not None else ""
+
+
+def _same_value(a, b) -> bool:
+    # Zahlen nach Wert: patch_cells schreibt 7.0 als <v>7</v>, gelesen kommt int 7 zurück.
+    # Sonst muss auch der Typ passen ("7" ist nicht 7, True nicht 1)
+    if type(a) in (int, float) and type(b) in (int, float):
+        return a == b
+    return type(a) is type(b) and a == b
+
+
+def _column_letter(col: int) -> str:
+    # 1 -> A, 13 -> M, 27 -> AA (wie openpyxl, ohne den Import)
+    out = ""
+    while col:
+        col, rem = divmod(col - 1, 26)
+        out = chr(65 + rem) + out
+    return out
+
+
+def _xml_cell_text(t: Optional[str], v: str) -> str:
+    # Wert eines <c> wie openpyxl ihn liefern würde, als Text (ohne Shared Strings)
+    if t == "b":
+        return "True" if v == "1" else "False"
+    if t in ("str", "e", "inlineStr"):
+        return v
+    if "." in v or "E" in v or "e" in v:
+        return str(float(v))
+    return str(int(v))
+
+
+@lru_cache(maxsize=2048)
+def _normalize_key(s: Optional[str]) -> str:
     return (s or "").strip().lower()
 
 
+def _xml_namespaces(data: bytes) -> list[tuple[str, str]]:
+    return [ns for _, ns in ET.iterparse(BytesIO(data), events=("start-ns",))]
+
+
+def _xml_tostring(root, namespaces: list[tuple[str, str]]) -> bytes:
+    """
+    Serialisiert wie ElementTree, behält aber alle Namespace-Deklarationen des Originals.
+    ET lässt ungenutzte Präfixe weg, Excel braucht sie aber (z.B. für mc:Ignorable="x14ac ...").
+    """
+    for prefix, uri in namespaces:
+        ET.register_namespace(prefix, uri)
+    body = ET.tostring(root, encoding="UTF-8", xml_declaration=False)
+
+    head_end = body.index(b">")
+    head = body[:head_end]
+    missing = b"".join(
+        (f' xmlns:{prefix}="{uri}"' if prefix else f' xmlns="{uri}"').encode()
+        for prefix, uri in namespaces
+        if (f"xmlns:{prefix}=" if prefix else "xmlns=").encode() not in head
+    )
+    if head.endswith(b"/"):
+        head_end -= 1
+    body = body[:head_end] + missing + body[head_end:]
+    return b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\r\n' + body
+
+
+# Ein Lock pro Datei, geteilt von allen ExcelIO-Instanzen auf denselben Pfad (siehe ExcelIO._lock)
+_FILE_LOCKS: dict[str, threading.RLock] = {}
+_FILE_LOCKS_GUARD = threading.Lock()
+
+
+def _file_lock(path: str) -> threading.RLock:
+    key = os.path.normcase(os.path.abspath(path))
+    with _FILE_LOCKS_GUARD:
+        lock = _FILE_LOCKS.get(key)
+        if lock is None:
+            lock = _FILE_LOCKS[key] = threading.RLock()
+        return lock
+
+
+def _locked(method):
+    # Öffentliche ExcelIO-Methoden nacheinander ausführen (Caches/Session werden geteilt)
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 @dataclass
 class EmployeeBlock:
     start_col: int
     width: int
+    # {Projekt (normalisiert): Spalte} aus Zeile 4, ohne Abs-Spalte
+    proj_cols: dict[str, int] = field(default_factory=dict)
 
     @property
     def abs_col(self) -> int:
         return self.start_col + self.width - 1
 
 
+@dataclass
+class SheetIndex:
+    """
+    Einmal pro Monatsblatt ermittelte Positionen.
+    date_to_row wird erst beim Schreiben gebraucht und daher bei Bedarf nachgetragen.
+    """
+    emp_blocks: dict[str, EmployeeBlock]
+    date_to_row: Optional[dict[date, int]] = None
+
+
 class ExcelIO:
     """
     Öffnet .xlsm mit keep_vba=True und schreibt Werte ähnlich zu deinem VBA.
+    Lesen (Listen, gefüllte Tage) läuft über openpyxl im read_only-Modus.
     """
 
-    def __init__(self, file_path: str, retries: int = 3, retry_wait_sec: float = 1.2):
+    def __init__(self, file_path: str, retries: int = 5, retry_wait_sec: float = 0.3):
         self.file_path = file_path
         self.retries = retries
         self.retry_wait_sec = retry_wait_sec
+        # Alle Caches gelten, solange die Datei den Stand _cache_stamp hat.
+        # Blatt-Caches sind nach (Blattname, data_only) getrennt (siehe _sheet_key):
+        # Kopfzeilen mit Formeln liefern je nach Modus "=..." oder den berechneten Wert.
+        # (Blattname, data_only) -> (Startspalten, Einträge) der Merges in HEADER_ROW
+        self._merge_index: dict[tuple[str, bool], tuple[list[int], list[tuple[int, int, str]]]] = {}
+        # Monat -> tatsächlicher Blattname (oder None). Nur Namen merken: ein Worksheet
+        # hält seine Arbeitsmappe fest und würde sie über den Aufruf hinaus am Leben halten
+        self._month_sheet_names: dict[int, Optional[str]] = {}
+        # (Blattname, data_only) -> Positionen im Blatt (siehe SheetIndex)
+        self._sheet_index: dict[tuple[str, bool], SheetIndex] = {}
+        self._cache_stamp: Optional[tuple[int, int]] = None
+        # Offene Arbeitsmappe + gesammelte Änderungen während session()
+        self._session_wb = None
+        self._session_changes: dict[str, dict[str, tuple[Any, bool]]] = {}
+        # Schützt Caches und Session-Mappe und ordnet Lesen/Schreiben derselben Datei, auch über
+        # Instanzen hinweg: unter Windows scheitert os.replace, solange ein Leser die Datei offen hat
+        self._lock = _file_lock(file_path)
+
+    # -------------------------
+    # Public: mehrere Schreibvorgänge, einmal speichern
+    # -------------------------
+    @contextmanager
+    def session(self):
+        """
+        with io.session(): io.write_range(...); io.write_range(...)
+        Öffnet die Mappe einmal und speichert am Ende einmal (nicht bei Exception).
+        Lesende Aufrufe in der Session sehen auch die noch nicht gespeicherten Werte.
+        """
+        # Lock für die ganze Session: andere Threads sehen die offene Mappe nie
+        with self._lock:
+            if self._session_wb is not None:
+                # Verschachtelt: die äußere Session speichert
+                yield self
+                return
+
+            self._check_cache_stamp()
+            wb = self._open_workbook_rw()
+            self._session_wb = wb
+            self._session_changes = {}
+            try:
+                yield self
+                self._save_changes(self._session_changes)
+            finally:
+                self._session_wb = None
+                self._session_changes = {}
+                wb.close()
+
+    @contextmanager
+    def locked(self):
+        """
+        with io.locked(): ...  Sperrt die Datei für alle ExcelIO-Zugriffe, solange der Block läuft.
+        Für eigene Dateizugriffe außerhalb von ExcelIO (z.B. Hash über den Inhalt).
+        """
+        with self._lock:
+            yield self
 
     # -------------------------
     # Public: Listen aus "Anpassung"
     # -------------------------
+    @_locked
     def load_lists(self) -> tuple[list[str], list[str], list[str]]:
-        wb = self._open_workbook()
-        try:
+        if self._session_wb is None:
+            try:
+                return self._load_lists_xml()
+            except Exception:
+                pass  # unerwarteter Aufbau der Datei -> openpyxl
+
+        with self._reading() as wb:
             if SHEET_EINGABE not in wb.sheetnames:
                 raise RuntimeError(f"Blatt '{SHEET_EINGABE}' nicht gefunden.")
             ws = wb[SHEET_EINGABE]
-            emps = self._unique_from_col(ws, COL_EMP, FIRST_ROW_LIST)
-            projs = self._unique_from_col(ws, COL_PROJ, FIRST_ROW_LIST)
-            abss = self._unique_from_col(ws, COL_ABS, FIRST_ROW_LIST)
+            emps, projs, abss = self._unique_from_cols(ws, (COL_EMP, COL_PROJ, COL_ABS), FIRST_ROW_LIST)
             return emps, projs, abss
-        finally:
-            wb.close()
+
+    def _load_lists_xml(self) -> tuple[list[str], list[str], list[str]]:
+        """
+        Listen direkt aus dem Sheet-XML (zipfile + ElementTree), ohne openpyxl-Objektmodell.
+        Wirft bei allem Unerwarteten, der Aufrufer liest dann mit openpyxl.
+        """
+        tag_c, tag_row, tag_v = f"{{{NS_MAIN}}}c", f"{{{NS_MAIN}}}row", f"{{{NS_MAIN}}}v"
+        tag_t, tag_r, tag_si = f"{{{NS_MAIN}}}t", f"{{{NS_MAIN}}}r", f"{{{NS_MAIN}}}si"
+        wanted = {_column_letter(c): i for i, c in enumerate((COL_EMP, COL_PROJ, COL_ABS))}
+
+        # Pro Spalte in Blattreihenfolge: Text oder Index in sharedStrings (int)
+        raw: tuple[list, ...] = ([], [], [])
+        shared_needed: set[int] = set()
+
+        with zipfile.ZipFile(self.file_path, "r") as zin:
+            part = self._sheet_parts(zin).get(SHEET_EINGABE)
+            if part is None:
+                raise RuntimeError(f"Blatt '{SHEET_EINGABE}' nicht gefunden.")
+
+            with zin.open(part) as src:
+                for _, el in ET.iterparse(src):
+                    if el.tag == tag_row:
+                        el.clear()
+                        continue
+                    if el.tag != tag_c:
+                        continue
+                    m = _CELL_REF.match(el.get("r", ""))
+                    if m is None:
+                        raise ValueError("Zelle ohne Adresse im Sheet-XML")
+                    i = wanted.get(m.group(1))
+                    if i is None or int(m.group(2)) < FIRST_ROW_LIST:
+                        continue
+
+                    t = el.get("t")
+                    if t == "inlineStr":
+                        raw[i].append("".join(x.text or "" for x in el.iter(tag_t)))
+                        continue
+                    v = el.findtext(tag_v)
+                    if not v:  # leer, z.B. Formel ohne berechneten Wert
+                        continue
+                    if t == "s":
+                        idx = int(v)
+                        shared_needed.add(idx)
+                        raw[i].append(idx)
+                    elif t in (None, "n") and el.get("s", "0") != "0":
+                        # Formatierte Zahl, evtl. Datum (openpyxl liefert dann datetime) -> openpyxl
+                        raise ValueError("Formatierte Zahl in Listenspalte")
+                    else:
+                        raw[i].append(_xml_cell_text(t, v))
+
+            shared: dict[int, str] = {}
+            if shared_needed:
+                with zin.open("xl/sharedStrings.xml") as src:
+                    idx = 0
+                    for _, el in ET.iterparse(src):
+                        if el.tag != tag_si:
+                            continue
+                        if idx in shared_needed:
+                            text = el.findtext(tag_t)
+                            if text is None:  # Rich Text: Läufe zusammensetzen
+                                text = "".join(r.findtext(tag_t) or "" for r in el.iterfind(tag_r))
+                            shared[idx] = text
+                        el.clear()
+                        idx += 1
+
+        outs: list[dict[str, None]] = [{}, {}, {}]
+        for values, out in zip(raw, outs):
+            for v in values:
+                s = _as_text(shared[v] if type(v) is int else v)
+                if s and s not in out:
+                    out[s] = None
+        emps, projs, abss = (list(out) for out in outs)
+        return emps, projs, abss
 
     # -------------------------
     # Public: Kalender-Markierung (gefüllte Tage)
     # -------------------------
+    @_locked
     def get_filled_days_for_employee(self, emp: str, month: date) -> set[date]:
         """
         Liefert alle Tage (Mo-Fr + Wochenende egal), an denen im Monatsblatt
@@ -106,8 +357,8 @@ class ExcelIO:
         if not emp:
             return set()
 
-        wb = self._open_workbook()
-        try:
+        self._check_cache_stamp()
+        with self._reading() as wb:
             ws = self._get_month_sheet(wb, month)
             if ws is None:
                 return set()
@@ -117,10 +368,12 @@ class ExcelIO:
                 return set()
 
             filled: set[date] = set()
-            max_row = ws.max_row
+            lo, hi = DATE_COL, block.start_col + block.width - 1
+            block_from = block.start_col - lo
 
-            for r in range(DATE_FIRST_ROW, max_row + 1):
-                dv = _as_date(ws.cell(r, DATE_COL).value)
+            # Ein Tupel pro Zeile (Datum ... Blockende), ohne Cell-Objekte
+            for row in ws.iter_rows(min_row=DATE_FIRST_ROW, min_col=lo, max_col=hi, values_only=True):
+                dv = _as_date(row[0])
                 if not dv:
                     continue
                 # Nur aktueller Monat
@@ -128,19 +381,15 @@ class ExcelIO:
                     continue
 
                 # Check alle Zellen im Mitarbeiterblock (inkl. Abs-Spalte)
-                for c in range(block.start_col, block.start_col + block.width):
-                    v = ws.cell(r, c).value
-                    if v not in (None, "", 0):
-                        filled.add(dv)
-                        break
+                if any(v not in (None, "", 0) for v in row[block_from:]):
+                    filled.add(dv)
 
             return filled
-        finally:
-            wb.close()
 
     # -------------------------
     # Public: Schreiben (mehrere Tage)
     # -------------------------
+    @_locked
     def write_range(
         self,
         emp: str,
@@ -162,170 +411,513 @@ class ExcelIO:
         if d_to < d_from:
             d_from, d_to = d_to, d_from
 
-        wb = self._open_workbook()
+        # Mo-Fr im Zeitraum, nach Monatsblatt gruppiert
+        by_month: dict[int, list[date]] = {}
+        cur = d_from
+        wd = cur.weekday()
+        if wd >= 5:  # Start am Wochenende -> nächster Montag
+            cur += timedelta(days=7 - wd)
+        while cur <= d_to:
+            by_month.setdefault(cur.month, []).append(cur)
+            wd = cur.weekday()
+            cur += timedelta(days=(7 - wd) if wd >= 4 else 1)  # Fr -> Mo
+
+        # In einer Session: offene Mappe mitbenutzen, gespeichert wird am Ende der Session
+        in_session = self._session_wb is not None
+        if in_session:
+            wb = self._session_wb
+            changes = self._session_changes
+        else:
+            self._check_cache_stamp()
+            wb = self._open_workbook_rw()
+            changes = {}
         ok = 0
         fail = 0
         try:
-            cur = d_from
-            while cur <= d_to:
-                if cur.weekday() <= 4:  # Mo=0 .. Fr=4
-                    if self._write_one_day(wb, cur, emp, mode, proj, hrs, abs_type):
+            for month, dates in by_month.items():
+                # Blatt, Datumszeilen, Mitarbeiter-Block und Projektspalte nur einmal pro Blatt suchen
+                ws = self._month_sheet(wb, month)
+                if ws is None:
+                    fail += len(dates)
+                    continue
+                date_rows = self._date_row_map(ws)
+                block = self._find_employee_block(ws, emp)
+                proj_col = 0
+                if block is not None and mode != "ABS":
+                    proj_col = self._find_project_col(ws, block, proj)
+
+                for dt in dates:
+                    if self._write_one_day_indexed(
+                        ws, date_rows.get(dt, 0), block, proj_col, mode, hrs, abs_type, changes
+                    ):
                         ok += 1
                     else:
                         fail += 1
-                cur += timedelta(days=1)
 
-            wb.save(self.file_path)
+            if not in_session:
+                self._save_changes(changes)
         finally:
-            wb.close()
+            if not in_session:
+                wb.close()
 
         return ok, fail
 
+    def _save_changes(self, changes: dict[str, dict[str, tuple[Any, bool]]]):
+        # Nur geänderte Zellen ins XML patchen, volles Speichern nur als Fallback
+        if not changes:
+            return
+        if not self.patch_cells(changes):
+            self._save_full(changes)
+        # Eigene Schreibzugriffe ändern weder Spalte C noch die Kopfzeilen -> Caches bleiben gültig,
+        # nur den neuen Dateistand merken
+        self._cache_stamp = self._file_stamp()
+
+    # -------------------------
+    # Public: Zellen direkt im XML der Datei ändern
+    # -------------------------
+    @_locked
+    def patch_cells(self, cells: dict[str, dict[str, tuple[Any, bool]]]) -> bool:
+        """
+        Schreibt Werte direkt in die Sheet-XMLs der .xlsm, ohne openpyxl-Roundtrip.
+        cells: {Blattname: {"F12": (wert, ist_text)}}, wert None = Zelle leeren.
+        Alle anderen Einträge im Zip (inkl. VBA) werden unverändert kopiert.
+
+        returns False (ohne etwas zu schreiben), wenn eine Zelle eine Formel enthält
+        -> dann muss mit openpyxl komplett gespeichert werden.
+        """
+        tmp = None
+        try:
+            with zipfile.ZipFile(self.file_path, "r") as zin:
+                parts = self._sheet_parts(zin)
+                replaced: dict[str, bytes] = {}
+
+                for sheet_name, sheet_cells in cells.items():
+                    part = parts[sheet_name]
+                    data = zin.read(part)
+                    root = ET.fromstring(data)
+                    if not self._patch_sheet_xml(root, sheet_cells):
+                        return False
+                    replaced[part] = _xml_tostring(root, _xml_namespaces(data))
+
+                # Abhängige Formeln beim Öffnen in Excel neu rechnen lassen (wie nach openpyxl-Save)
+                wb_xml = zin.read("xl/workbook.xml")
+                replaced["xl/workbook.xml"] = re.sub(
+                    rb"<calcPr\b(?![^>]*fullCalcOnLoad)", b'<calcPr fullCalcOnLoad="1"', wb_xml, count=1
+                )
+
+                fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.file_path) or None, suffix=".tmp")
+                with os.fdopen(fd, "wb") as f, zipfile.ZipFile(f, "w") as zout:
+                    for item in zin.infolist():
+                        data = replaced.get(item.filename)
+                        zout.writestr(item, data if data is not None else zin.read(item.filename))
+
+            # Erst nach dem Schließen ersetzen; unter Windows schlägt das fehl, solange Excel
+            # die Datei offen hat -> temp-Datei darf dann nicht im Ordner liegen bleiben
+            os.replace(tmp, self.file_path)
+            tmp = None
+        finally:
+            if tmp is not None:
+                with suppress(OSError):
+                    os.remove(tmp)
+        return True
+
     # -------------------------
     # Internal: Workbook öffnen mit Retry
     # -------------------------
-    def _open_workbook(self):
+    def _save_full(self, changes: dict[str, dict[str, tuple[Any, bool]]]):
+        # Die Schreib-Mappe ist ohne externe Verknüpfungen geöffnet; ein wb.save darauf würde
+        # sie aus der Datei entfernen -> fürs Vollspeichern mit Verknüpfungen neu öffnen
+        wb = self._open_workbook(keep_vba=True)
+        try:
+            for sheet, cells in changes.items():
+                ws = wb[sheet]
+                for ref, (value, _) in cells.items():
+                    ws[ref].value = value
+            wb.save(self.file_path)
+        finally:
+            wb.close()
+
+    def _open_workbook_rw(self):
+        # Zum Schreiben: volle Arbeitsmappe inkl. VBA, Formeln bleiben erhalten (data_only=False).
+        # Externe Verknüpfungen (Caches) werden nicht gelesen, die App wertet sie nie aus.
+        return self._open_workbook(keep_vba=True, keep_links=False)
+
+    @contextmanager
+    def _reading(self):
+        # In einer Session die offene Mappe lesen, sonst read_only öffnen und wieder schließen
+        if self._session_wb is not None:
+            yield self._session_wb
+            return
+        wb = self._open_workbook_ro()
+        try:
+            yield wb
+        finally:
+            wb.close()
+
+    def _open_workbook_ro(self):
+        # Nur Lesen: gestreamt, berechnete Werte statt Formeln, ohne externe Links
+        wb = self._open_workbook(read_only=True, data_only=True, keep_links=False)
+        # <dimension> im Sheet-XML kann fehlen oder zu klein sein -> nicht verwenden.
+        # Kostet nichts (setzt nur max_row/max_column zurück), iter_rows liest dann bis zum Blattende
+        for ws in wb.worksheets:
+            ws.reset_dimensions()
+        return wb
+
+    def _open_workbook(self, **kwargs):
+        import openpyxl
+
         last_err = None
-        for _ in range(self.retries):
+        for i in range(self.retries):
             try:
-                return openpyxl.load_workbook(self.file_path, keep_vba=True)
-            except Exception as e:
+                return openpyxl.load_workbook(self.file_path, **kwargs)
+            except (FileNotFoundError, IsADirectoryError) as e:
+                # Wird durch Warten nicht besser
+                raise RuntimeError(f"Excel-Datei nicht gefunden: {e}") from e
+            except (OSError, zipfile.BadZipFile) as e:
+                # Gesperrt (PermissionError) oder halb geschrieben, während Excel speichert
                 last_err = e
-                time.sleep(self.retry_wait_sec)
+            if i + 1 < self.retries:
+                # Exponentiell warten (mit etwas Zufall, damit wir nicht im Takt von Excels Speichern bleiben)
+                time.sleep(min(self.retry_wait_sec * 2 ** i, RETRY_WAIT_MAX_SEC) + random.uniform(0, 0.2))
         raise RuntimeError(f"Excel-Datei konnte nicht geöffnet werden (evtl. gesperrt): {last_err}")
 
+    # -------------------------
+    # Internal: Blattname -> Sheet-XML im Zip
+    # -------------------------
+    def _sheet_parts(self, zin: zipfile.ZipFile) -> dict[str, str]:
+        rels = ET.fromstring(zin.read("xl/_rels/workbook.xml.rels"))
+        targets = {}
+        for rel in rels.iter(f"{{{NS_PKG_REL}}}Relationship"):
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join("xl", target))
+            targets[rel.get("Id")] = target
+
+        wb = ET.fromstring(zin.read("xl/workbook.xml"))
+        return {
+            sh.get("name"): targets[sh.get(f"{{{NS_REL}}}id")]
+            for sh in wb.iter(f"{{{NS_MAIN}}}sheet")
+        }
+
+    # -------------------------
+    # Internal: Zellwerte in einem Sheet-XML setzen
+    # -------------------------
+    def _patch_sheet_xml(self, root, sheet_cells: dict[str, tuple[Any, bool]]) -> bool:
+        from openpyxl.utils.cell import column_index_from_string, coordinate_from_string
+
+        sheet_data = root.find(f"{{{NS_MAIN}}}sheetData")
+        if sheet_data is None:
+            return False
+
+        rows = {}
+        for row_el in sheet_data:
+            if row_el.get("r") is None:
+                return False
+            rows[int(row_el.get("r"))] = row_el
+
+        for ref, (value, is_str) in sheet_cells.items():
+            col_letter, row = coordinate_from_string(ref)
+            col = column_index_from_string(col_letter)
+
+            row_el = rows.get(row)
+            if row_el is None:
+                if value is None:
+                    continue
+                row_el = ET.Element(f"{{{NS_MAIN}}}row", {"r": str(row)})
+                pos = sum(1 for r in rows if r < row)
+                sheet_data.insert(pos, row_el)
+                rows[row] = row_el
+
+            c_el = None
+            pos = 0
+            for i, el in enumerate(row_el):
+                r = el.get("r")
+                if r is None:
+                    return False
+                c = column_index_from_string(coordinate_from_string(r)[0])
+                if c == col:
+                    c_el = el
+                    break
+                if c < col:
+                    pos = i + 1
+
+            if c_el is None:
+                if value is None:
+                    continue
+                c_el = ET.Element(f"{{{NS_MAIN}}}c", {"r": ref})
+                row_el.insert(pos, c_el)
+                row_el.attrib.pop("spans", None)  # optionaler Hinweis, würde sonst evtl. nicht mehr passen
+
+            if c_el.find(f"{{{NS_MAIN}}}f") is not None:
+                return False
+
+            for child in list(c_el):
+                c_el.remove(child)
+            c_el.attrib.pop("t", None)
+
+            if value is None:
+                continue
+            if is_str:
+                c_el.set("t", "inlineStr")
+                is_el = ET.SubElement(c_el, f"{{{NS_MAIN}}}is")
+                ET.SubElement(is_el, f"{{{NS_MAIN}}}t").text = str(value)
+            else:
+                num = float(value)
+                ET.SubElement(c_el, f"{{{NS_MAIN}}}v").text = str(int(num)) if num.is_integer() else repr(num)
+
+        return True
+
     # -------------------------
     # Internal: Monatsblatt holen
     # -------------------------
     def _get_month_sheet(self, wb, month: date):
-        nm = month_sheet_name(month)
+        return self._month_sheet(wb, month.month)
+
+    def _month_sheet(self, wb, month: int):
+        # Namen einmal pro Dateistand auflösen, das Worksheet jedes Mal frisch aus wb holen
+        if not self._month_sheet_names:
+            self._month_sheet_names = {m: self._resolve_sheet_name(wb, nm) for m, nm in MONTH_DE.items()}
+        name = self._month_sheet_names[month]
+        return wb[name] if name is not None else None
+
+    def _resolve_sheet_name(self, wb, nm: str) -> Optional[str]:
         if nm in wb.sheetnames:
-            return wb[nm]
+            return nm
         if nm == "März" and "Maerz" in wb.sheetnames:
-            return wb["Maerz"]
+            return "Maerz"
         return None
 
     # -------------------------
     # Internal: Unique List aus Spalte
     # -------------------------
-    def _unique_from_col(self, ws, col: int, first_row: int) -> list[str]:
-        out = []
-        seen = set()
-        max_row = ws.max_row
-        for r in range(first_row, max_row + 1):
-            v = ws.cell(r, col).value
-            s = (str(v).strip() if v is not None else "")
-            if s and s not in seen:
-                seen.add(s)
-                out.append(s)
-        return out or []
+    def _unique_from_cols(self, ws, cols: tuple[int, ...], first_row: int) -> list[list[str]]:
+        # Ein Durchlauf über alle Spalten von min(cols) bis max(cols), Reihenfolge wie im Blatt
+        lo, hi = min(cols), max(cols)
+        offsets = [c - lo for c in cols]
+        outs: list[dict[str, None]] = [{} for _ in cols]
+        for row in ws.iter_rows(min_row=first_row, min_col=lo, max_col=hi, values_only=True):
+            for i, out in zip(offsets, outs):
+                s = _as_text(row[i]) if i < len(row) else ""
+                if s and s not in out:
+                    out[s] = None
+        return [list(out) for out in outs]
 
     # -------------------------
-    # Internal: 1 Tag schreiben (wie VBA)
+    # Internal: 1 Tag schreiben (wie VBA), Zeile/Block/Spalte vorab gesucht
     # -------------------------
-    def _write_one_day(
+    def _write_one_day_indexed(
         self,
-        wb,
-        dt: date,
-        emp: str,
+        ws,
+        day_row: int,
+        block: Optional[EmployeeBlock],
+        proj_col: int,
         mode: str,
-        proj: str,
         hrs: float,
         abs_type: str,
+        changes: dict[str, dict[str, tuple[Any, bool]]],
     ) -> bool:
-        ws = self._get_month_sheet(wb, dt)
-        if ws is None:
-            return False
-
-        day_row = self._find_date_row(ws, dt)
-        if day_row == 0:
-            return False
-
-        block = self._find_employee_block(ws, emp)
-        if block is None:
+        if day_row == 0 or block is None:
             return False
 
         abs_col = block.abs_col
 
         if mode == "ABS":
-            ws.cell(day_row, abs_col).value = abs_type
-            for c in range(block.start_col, abs_col):
-                ws.cell(day_row, c).value = None
+            self._set_value(ws, day_row, abs_col, abs_type, changes)
+            if abs_col > block.start_col:
+                # Projektspalten einmal lesen und nur nicht-leere Zellen leeren
+                current = [col[0] for col in ws.iter_cols(
+                    min_row=day_row, max_row=day_row,
+                    min_col=block.start_col, max_col=abs_col - 1,
+                    values_only=True,
+                )]
+                for c, v in zip(range(block.start_col, abs_col), current):
+                    if v is not None and v != "":
+                        self._set_value(ws, day_row, c, None, changes)
             return True
 
-        proj_col = self._find_project_col(ws, block, proj)
         if proj_col == 0:
             return False
 
-        ws.cell(day_row, proj_col).value = float(hrs)
-        ws.cell(day_row, abs_col).value = None
+        self._set_value(ws, day_row, proj_col, float(hrs), changes)
+        self._set_value(ws, day_row, abs_col, None, changes)
         return True
 
+    def _set_value(self, ws, row: int, col: int, value, changes: dict[str, dict[str, tuple[Any, bool]]]):
+        from openpyxl.utils.cell import get_column_letter
+
+        cell = ws.cell(row, col)
+        if _same_value(cell.value, value):
+            return  # steht schon so in der Datei (bzw. ist in der Session schon vermerkt)
+
+        # In der Arbeitsmappe setzen (für evtl. Vollspeichern) und für patch_cells merken
+        cell.value = value
+        changes.setdefault(ws.title, {})[f"{get_column_letter(col)}{row}"] = (value, isinstance(value, str))
+
+    # -------------------------
+    # Internal: Datum -> Zeile (Spalte C), einmal pro Blatt
+    # -------------------------
+    def _date_row_map(self, ws) -> dict[date, int]:
+        index = self._get_sheet_index(ws)
+        if index.date_to_row is not None:
+            return index.date_to_row
+
+        rows: dict[date, int] = {}
+        for r, (v,) in enumerate(
+            ws.iter_rows(min_row=DATE_FIRST_ROW, min_col=DATE_COL, max_col=DATE_COL, values_only=True),
+            start=DATE_FIRST_ROW,
+        ):
+            dv = _as_date(v)
+            if dv:
+                rows.setdefault(dv, r)  # erste Fundstelle gewinnt (wie zuvor die lineare Suche)
+        index.date_to_row = rows
+        return rows
+
+    # -------------------------
+    # Internal: Blatt-Index (Kopfzeilen einmal lesen)
+    # -------------------------
+    def _sheet_key(self, ws) -> tuple[str, bool]:
+        return ws.title, bool(getattr(ws.parent, "data_only", False))
+
+    def _get_sheet_index(self, ws) -> SheetIndex:
+        key = self._sheet_key(ws)
+        index = self._sheet_index.get(key)
+        if index is None:
+            index = self._sheet_index[key] = self._build_sheet_index(ws)
+        return index
+
+    def _build_sheet_index(self, ws) -> SheetIndex:
+        blocks = self._build_block_map(ws)
+
+        # Zeile 4 in einem Zug lesen und die Projektspalten direkt am Block ablegen
+        if blocks:
+            hi = max(b.abs_col for b in blocks.values())
+            row = next(ws.iter_rows(
+                min_row=SUBHEADER_ROW, max_row=SUBHEADER_ROW,
+                min_col=FIRST_EMP_COL, max_col=hi,
+                values_only=True,
+            ), ())
+            for block in blocks.values():
+                for c in range(block.start_col, block.abs_col):
+                    i = c - FIRST_EMP_COL
+                    key = _as_text(row[i]).lower() if i < len(row) else ""
+                    if key:
+                        block.proj_cols.setdefault(key, c)  # erste Fundstelle gewinnt
+
+        return SheetIndex(emp_blocks=blocks)
+
     # -------------------------
-    # Internal: Datumszeile finden (Spalte C)
+    # Internal: Cache-Gültigkeit über mtime/Größe der Datei
     # -------------------------
-    def _find_date_row(self, ws, dt: date) -> int:
-        max_row = ws.max_row
-        target = dt
-        for r in range(DATE_FIRST_ROW, max_row + 1):
-            dv = _as_date(ws.cell(r, DATE_COL).value)
-            if dv and dv == target:
-                return r
-        return 0
+    def _file_stamp(self) -> Optional[tuple[int, int]]:
+        try:
+            st = os.stat(self.file_path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _check_cache_stamp(self):
+        # Datei wurde von außen geändert (z.B. in Excel gespeichert) -> Caches verwerfen
+        stamp = self._file_stamp()
+        if stamp != self._cache_stamp:
+            self._merge_index.clear()
+            self._month_sheet_names.clear()
+            self._sheet_index.clear()
+            self._cache_stamp = stamp
 
     # -------------------------
     # Internal: Mitarbeiter-Block finden (Zeile 3, ggf. Merges)
     # -------------------------
     def _find_employee_block(self, ws, emp: str) -> Optional[EmployeeBlock]:
-        emp_key = _normalize_key(emp)
+        return self._get_sheet_index(ws).emp_blocks.get(_normalize_key(emp))
+
+    def _build_block_map(self, ws) -> dict[str, EmployeeBlock]:
+        # Kopfzeile bis zum Ende ablaufen, alle Mitarbeiter-Blöcke merken (erste Fundstelle gewinnt).
+        # Dimension aus dem Sheet-XML ist nicht verlässlich (fehlt im read_only-Modus
+        # ggf. ganz oder steht auf XFD) -> Suche immer begrenzen
+        scan_limit = FIRST_EMP_COL + MAX_EMP_SCAN_COLS
+        max_c = min(ws.max_column or scan_limit, scan_limit)
+        if max_c < FIRST_EMP_COL:
+            return {}
+
+        # Zeile 3 einmal lesen; verbundene Bereiche liefern Wert und Breite aus dem Merge-Index
+        header = next(ws.iter_rows(
+            min_row=HEADER_ROW, max_row=HEADER_ROW,
+            min_col=FIRST_EMP_COL, max_col=max_c,
+            values_only=True,
+        ), ())
+
+        blocks: dict[str, EmployeeBlock] = {}
         c = FIRST_EMP_COL
-        empty_streak = 0
-        max_c = ws.max_column
-
         while c <= max_c:
-            name, width, next_c = self._header_cell_value_and_width(ws, HEADER_ROW, c)
-            name_key = _normalize_key(name)
-
+            name, width, next_c = self._header_cell_value_and_width(ws, header, c)
+            name_key = name.lower()  # schon getrimmt (_as_text)
             if name_key:
-                empty_streak = 0
-                if name_key == emp_key:
-                    return EmployeeBlock(start_col=c, width=width)
-            else:
-                empty_streak += 1
-
+                blocks.setdefault(name_key, EmployeeBlock(start_col=c, width=width))
             c = next_c
-            if empty_streak >= 15:
-                break
 
-        return None
+        return blocks
 
-    def _header_cell_value_and_width(self, ws, row: int, col: int) -> tuple[str, int, int]:
-        cell = ws.cell(row, col)
-
-        merged_range = None
-        for rng in ws.merged_cells.ranges:
-            if rng.min_row <= row <= rng.max_row and rng.min_col <= col <= rng.max_col:
-                merged_range = rng
-                break
-
-        if merged_range:
-            top_left = ws.cell(merged_range.min_row, merged_range.min_col)
-            val = top_left.value
-            width = merged_range.max_col - merged_range.min_col + 1
-            start_col = merged_range.min_col
-            next_col = start_col + width
-            return (str(val).strip() if val is not None else ""), width, next_col
-
-        val = cell.value
-        return (str(val).strip() if val is not None else ""), 1, col + 1
+    def _merged_ranges_in_row(self, ws, row: int) -> list[tuple[int, int, int, int]]:
+        """
+        Verbundene Bereiche, die Zeile row schneiden, als (min_col, min_row, max_col, max_row).
+        Merges im Datenbereich werden gleich verworfen. Im read_only-Modus kennt openpyxl
+        keine merged_cells -> <mergeCell>-Einträge direkt aus dem Sheet-XML lesen.
+        """
+        merged_cells = getattr(ws, "merged_cells", None)
+        if merged_cells is not None:
+            return [
+                rng.bounds for rng in merged_cells.ranges
+                if rng.min_row <= row <= rng.max_row
+            ]
+
+        from openpyxl.utils.cell import range_boundaries
+
+        ranges = []
+        with ws._get_source() as src:
+            for _, el in ET.iterparse(src):
+                tag = el.tag.rsplit("}", 1)[-1]
+                if tag == "mergeCell":
+                    bounds = range_boundaries(el.get("ref"))
+                    if bounds[1] <= row <= bounds[3]:
+                        ranges.append(bounds)
+                elif tag == "row":
+                    el.clear()
+        return ranges
+
+    def _merge_index_for_row3(self, ws) -> tuple[list[int], list[tuple[int, int, str]]]:
+        """
+        Verbundene Bereiche in HEADER_ROW, nach Startspalte sortiert:
+        (Startspalten, [(Endspalte, Breite, Wert)]) als parallele Listen für bisect.
+        Wird einmal pro Blatt aufgebaut statt pro Spalte alle Merges zu durchsuchen.
+        """
+        key = self._sheet_key(ws)
+        index = self._merge_index.get(key)
+        if index is None:
+            starts = []
+            entries = []
+            for min_col, min_row, max_col, _ in sorted(self._merged_ranges_in_row(ws, HEADER_ROW)):
+                val = ws.cell(min_row, min_col).value
+                starts.append(min_col)
+                entries.append((max_col, max_col - min_col + 1, _as_text(val)))
+            index = self._merge_index[key] = (starts, entries)
+        return index
+
+    def _header_cell_value_and_width(self, ws, header: tuple, col: int) -> tuple[str, int, int]:
+        # header: Werte aus HEADER_ROW ab FIRST_EMP_COL
+        starts, entries = self._merge_index_for_row3(ws)
+        i = bisect_right(starts, col) - 1
+        if i >= 0 and col <= entries[i][0]:
+            _, width, val = entries[i]
+            start_col = starts[i]
+            return val, width, start_col + width
+
+        k = col - FIRST_EMP_COL
+        return (_as_text(header[k]) if k < len(header) else ""), 1, col + 1
 
     # -------------------------
     # Internal: Projektspalte finden (Zeile 4 innerhalb Block, ohne Abs-Spalte)
     # -------------------------
     def _find_project_col(self, ws, block: EmployeeBlock, proj: str) -> int:
-        proj_key = _normalize_key(proj)
-        for c in range(block.start_col, block.start_col + block.width - 1):
-            v = ws.cell(SUBHEADER_ROW, c).value
-            if _normalize_key(str(v) if v is not None else "") == proj_key:
-                return c
-        return 0
+        return block.proj_cols.get(_normalize_key(proj), 0)